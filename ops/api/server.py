@@ -110,14 +110,30 @@ def health():
     return {"status": "ok"}
 
 
+LATEST_PATH = Path("ops/decisions/latest.json")
+
+# (st_ino, st_mtime_ns, st_size, parsed latest.json) of the last read; requests
+# between two decision runs are served from memory after a single stat().
+# The inode changes with every atomic replace, even within one mtime tick.
+_latest_cache: tuple[int, int, int, dict] | None = None
+
+
 @app.get("/decision/latest")
 def latest_decision():
-    latest_path = Path("ops/decisions/latest.json")
-    if not latest_path.exists():
+    global _latest_cache
+    try:
+        st = LATEST_PATH.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="latest.json not found")
 
-    with latest_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    cached = _latest_cache
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    if cached is not None and cached[:3] == key:
+        return cached[3]
+
+    data = json.loads(LATEST_PATH.read_bytes())
+    _latest_cache = (*key, data)
+    return data
 
 
 @app.post("/decision/run")
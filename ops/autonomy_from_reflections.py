@@ -55,7 +55,7 @@ def impact_score(refl: dict) -> float:
         s -= 0.10
 
     # clamp impact to [-1, +1]
-    return max(-1.0, min(1.0, s))
+    return -1.0 if s < -1.0 else (1.0 if s > 1.0 else s)
 
 def main(window_size=20, alpha=0.05):
     os.makedirs(os.path.dirname(OUT_FILE), exist_ok=True)
@@ -63,15 +63,17 @@ def main(window_size=20, alpha=0.05):
     files = sorted(glob.glob(os.path.join(REFL_DIR, "reflection_*.json")))
     recent = files[-window_size:] if len(files) > window_size else files
 
-    impacts = []
+    # running sums only; the per-file values are never needed individually
+    impact_sum = 0.0
     successes = 0
     human_req = 0
     policy_viol = 0
-    q_vals = []
+    q_sum = 0.0
+    q_count = 0
 
     for fp in recent:
         r = load_json(fp)
-        impacts.append(impact_score(r))
+        impact_sum += impact_score(r)
 
         if safe_get(r, ["decision_ref", "status"]) == "success":
             successes += 1
@@ -83,12 +85,13 @@ def main(window_size=20, alpha=0.05):
         q = safe_get(r, ["reflection", "decision_quality"], None)
         if isinstance(q, dict):
             q_avg = (q.get("clarity", 0.5) + q.get("safety", 0.5) + q.get("reversibility", 0.5)) / 3.0
-            q_vals.append(q_avg)
+            q_sum += q_avg
+            q_count += 1
 
-    mean_impact = sum(impacts) / len(impacts) if impacts else 0.0
+    mean_impact = impact_sum / len(recent) if recent else 0.0
     success_rate = successes / len(recent) if recent else 0.0
     human_rate = human_req / len(recent) if recent else 0.0
-    avg_q = sum(q_vals) / len(q_vals) if q_vals else 0.5
+    avg_q = q_sum / q_count if q_count else 0.5
 
     # current autonomy from ops/autonomy.json (fallback 0.5)
     try:
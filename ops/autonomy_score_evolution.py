@@ -7,18 +7,24 @@ OPS = Path(__file__).resolve().parent
 DEC_SNAP = OPS / "decisions" / "snapshots"
 HEALTH_LOG = OPS / "reports" / "health_log.jsonl"
 
-def load_health_series():
-    series = []
+def load_health_by_date():
+    """Map date -> last health entry that day (best-effort), built while reading."""
+    health_by_date = {}
     if not HEALTH_LOG.exists():
-        return series
-    for line in HEALTH_LOG.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            series.append(json.loads(line))
-        except json.JSONDecodeError:
-            pass
-    return series
+        return health_by_date
+    with HEALTH_LOG.open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                h = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            ts = h.get("timestamp") or h.get("last_updated")
+            if not ts:
+                continue
+            health_by_date[ts.split("T")[0]] = h
+    return health_by_date
 
 def load_snapshots():
     snaps = []
@@ -35,28 +41,24 @@ def clamp(x):
     return max(0.0, min(1.0, x))
 
 def main():
-    health = load_health_series()
+    health_by_date = load_health_by_date()
     snaps = load_snapshots()
 
-    # Map date -> last health entry that day (best-effort)
-    health_by_date = {}
-    for h in health:
-        ts = h.get("timestamp") or h.get("last_updated")
-        if not ts:
-            continue
-        d = ts.split("T")[0]
-        health_by_date[d] = h
-
     rows = []
     for s in snaps:
         date = s.get("date")
+        if not date:
+            # not a daily counter snapshot (e.g. latest_snapshot.json, schema)
+            continue
         total = int(s.get("total_decisions", 0))
         succ = int(s.get("successful", 0))
         fail = int(s.get("failed", 0))
-        blocked = 0
-        by_agent = s.get("by_agent", {}) or {}
-        for a, st in by_agent.items():
-            blocked += int(st.get("blocked", 0))
+        # daily snapshots carry a global counter; only older ones need the per-agent sum
+        if "blocked" in s:
+            blocked = int(s.get("blocked") or 0)
+        else:
+            by_agent = s.get("by_agent", {}) or {}
+            blocked = sum(int(st.get("blocked", 0)) for st in by_agent.values())
 
         executed = succ + fail
         exec_rate = (succ / executed) if executed else 0.0
@@ -22,11 +22,19 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    from ops.jsonio import read_last_line
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import read_last_line
+
 try:
     import yaml  # type: ignore
 except Exception:
     yaml = None
 
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 REGISTRY_PATH = Path("agents/registry.yaml")
 DECISION_TRACE_JSONL = Path("ops/reports/decision_trace.jsonl")
 SYSTEM_STATUS = "ops/reports/system_status.json"
@@ -46,15 +54,16 @@ def warn(code: str, msg: str) -> None:
 def load_yaml(path: Path) -> dict:
     if yaml is None:
         raise RuntimeError("PyYAML not available. Add pyyaml to workflow deps or vendor a minimal parser.")
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    with path.open("rb") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
-def load_last_jsonl_entry(path: Path) -> dict:
-    lines = [ln.strip() for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
-    if not lines:
+def load_last_jsonl_entry(path: Path, chunk: int = 4096) -> dict:
+    """Decode the last non-empty line, reading backwards from EOF."""
+    line = read_last_line(path, chunk)
+    if not line:
         raise ValueError("empty jsonl")
-    return json.loads(lines[-1])
+    return json.loads(line.decode("utf-8"))
 
 
 def main() -> int:
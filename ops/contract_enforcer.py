@@ -50,7 +50,7 @@ def load_json(path: Path, default: Any) -> Any:
         return default
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContractDecision:
     mode: str
     propose_ok: bool
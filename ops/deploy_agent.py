@@ -12,11 +12,17 @@ Rules:
 from __future__ import annotations
 
 import json
+import os
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    from ops.jsonio import read_last_line
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import read_last_line
+
 
 ROOT = Path(__file__).resolve().parents[1]  # repo root
 STATUS_FILE = ROOT / "ops" / "reports" / "system_status.json"
@@ -34,13 +40,20 @@ MODE = "simulation_only"
 DEFAULT_HEALTH_MIN_SCORE = 0.70
 
 
+_ISO_CACHE: tuple[int, str] = (-1, "")
+
+
 def now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    """UTC timestamp with second resolution; formatted once per wall-clock second."""
+    global _ISO_CACHE
+    sec = int(time.time())
+    if _ISO_CACHE[0] != sec:
+        _ISO_CACHE = (sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec)))
+    return _ISO_CACHE[1]
 
 
 def read_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
+    # a missing file lands in the except branch; no separate exists() probe
     try:
         return json.loads(path.read_text(encoding="utf-8"))
     except Exception:
@@ -48,24 +61,29 @@ def read_json(path: Path) -> Dict[str, Any]:
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Atomic write (temp file + os.replace); readers never see a half-written status file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def read_last_event(path: Path) -> Optional[Dict[str, Any]]:
-    if not path.exists():
-        return None
     try:
-        lines = [ln.strip() for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
-        if not lines:
+        last = read_last_line(path, 4096)
+        if last is None:
             return None
-        return json.loads(lines[-1])
+        return json.loads(last.decode("utf-8"))
     except Exception:
         return None
 
 
 def is_emergency_locked() -> bool:
-    if not EMERGENCY_LOCK_FILE.exists():
+    # fast path: a single stat() answers the common "no lock file" case
+    try:
+        if EMERGENCY_LOCK_FILE.stat().st_size == 0:
+            return False
+    except FileNotFoundError:
         return False
     try:
         data = read_json(EMERGENCY_LOCK_FILE)
@@ -75,6 +93,23 @@ def is_emergency_locked() -> bool:
         return True
 
 
+def _default_system_state() -> Dict[str, Any]:
+    return {"status": "online", "mode": "stabilization"}
+
+
+def _default_health() -> Dict[str, Any]:
+    return {"overall_score": 0.0, "signal": "unknown", "metrics": {}}
+
+
+# status sections that must be dicts, with a factory for a fresh default
+_STATUS_SECTIONS = (
+    ("agents", dict),
+    ("policy", dict),
+    ("system_state", _default_system_state),
+    ("health", _default_health),
+)
+
+
 def ensure_status_minimal(status: Dict[str, Any]) -> Dict[str, Any]:
     if not status:
         status = {
@@ -82,8 +117,8 @@ def ensure_status_minimal(status: Dict[str, Any]) -> Dict[str, Any]:
             "generated_at": now_iso(),
             "source": "deploy_agent",
             "environment": "production",
-            "system_state": {"status": "online", "mode": "stabilization"},
-            "health": {"overall_score": 0.0, "signal": "unknown", "metrics": {}},
+            "system_state": _default_system_state(),
+            "health": _default_health(),
             "agents": {},
             "policy": {
                 "deploy_requires_human_approval": True,
@@ -94,18 +129,14 @@ def ensure_status_minimal(status: Dict[str, Any]) -> Dict[str, Any]:
                 },
             },
         }
-    if not isinstance(status.get("agents"), dict):
-        status["agents"] = {}
-    if not isinstance(status.get("policy"), dict):
-        status["policy"] = {}
-    if not isinstance(status.get("system_state"), dict):
-        status["system_state"] = {"status": "online", "mode": "stabilization"}
-    if not isinstance(status.get("health"), dict):
-        status["health"] = {"overall_score": 0.0, "signal": "unknown", "metrics": {}}
+        return status
+    for key, default in _STATUS_SECTIONS:
+        if not isinstance(status.get(key), dict):
+            status[key] = default()
     return status
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     deploy_requires_human_approval: bool
     health_min_score: float
@@ -113,9 +144,15 @@ class Policy:
     require_self_guardian_green: bool
 
 
+def _safe_dict(d: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """d[key] if it is a dict, else {} (one lookup)."""
+    v = d.get(key)
+    return v if isinstance(v, dict) else {}
+
+
 def load_policy(status: Dict[str, Any]) -> Policy:
-    policy = status.get("policy", {}) if isinstance(status.get("policy"), dict) else {}
-    hard = policy.get("hard_stop", {}) if isinstance(policy.get("hard_stop"), dict) else {}
+    policy = _safe_dict(status, "policy")
+    hard = _safe_dict(policy, "hard_stop")
 
     return Policy(
         deploy_requires_human_approval=bool(policy.get("deploy_requires_human_approval", True)),
@@ -126,27 +163,17 @@ def load_policy(status: Dict[str, Any]) -> Policy:
 
 
 def get_guardian_health(status: Dict[str, Any]) -> str:
-    agents = status.get("agents", {})
-    guardian = agents.get("guardian", {}) if isinstance(agents, dict) else {}
-    if isinstance(guardian, dict):
-        return str(guardian.get("health", "")).lower()
-    return ""
+    guardian = _safe_dict(_safe_dict(status, "agents"), "guardian")
+    return str(guardian.get("health", "")).lower()
 
 
 def get_deployment_gate(status: Dict[str, Any]) -> Dict[str, Any]:
-    agents = status.get("agents", {})
-    if not isinstance(agents, dict):
-        return {}
-    dep = agents.get("deployment", {})
-    return dep if isinstance(dep, dict) else {}
+    return _safe_dict(_safe_dict(status, "agents"), "deployment")
 
 
 def checks(status: Dict[str, Any], policy: Policy) -> Dict[str, Dict[str, Any]]:
-    sys_state = status.get("system_state", {})
-    sys_status = str((sys_state or {}).get("status", "")).lower()
-
-    health = status.get("health", {})
-    health_score = float((health or {}).get("overall_score", 0.0))
+    sys_status = str(_safe_dict(status, "system_state").get("status", "")).lower()
+    health_score = float(_safe_dict(status, "health").get("overall_score", 0.0))
 
     guardian_health = get_guardian_health(status)
 
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -25,6 +26,15 @@ except ImportError:
     print("Missing dependency: pyyaml. Add to workflow: pip install pyyaml", file=sys.stderr)
     sys.exit(2)
 
+# libyaml-backed loader when PyYAML was built with it (pure-Python fallback)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    from ops.jsonio import dumps, loads
+except ImportError:  # run as `python ops/george/run.py`: make the repo root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from ops.jsonio import dumps, loads
+
 
 # ---------------------------------------------------------------------
 # Paths
@@ -34,6 +44,9 @@ REPO_ROOT = Path(__file__).resolve().parents[2]  # ops/george/run.py -> repo roo
 RULES_FILE = REPO_ROOT / "ops" / "rules" / "george_rules.yaml"
 STATUS_FILE = REPO_ROOT / "ops" / "reports" / "system_status.json"
 
+# repo-relative rules path as recorded in every decision (invariant per process)
+RULES_FILE_REL = str(RULES_FILE.relative_to(REPO_ROOT))
+
 DECISIONS_DIR = REPO_ROOT / "ops" / "decisions"
 LATEST_DECISION = DECISIONS_DIR / "latest.json"
 DECISIONS_LOG = DECISIONS_DIR / "decisions.jsonl"
@@ -49,8 +62,8 @@ def now_iso() -> str:
 def load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Rules file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    with path.open("rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
     return data or {}
 
 
@@ -58,24 +71,36 @@ def load_json(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f) or {}
+        return loads(path.read_bytes()) or {}
     except Exception:
         return {}
 
 
-def write_json(path: Path, data: Dict[str, Any]) -> None:
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with tmp.open("wb") as f:
+        f.write(payload)
+        # make the new content durable before it becomes visible under `path`
+        f.flush()
+        os.fsync(f.fileno())
     tmp.replace(path)
 
 
-def append_jsonl(path: Path, obj: Dict[str, Any]) -> None:
+def _append_line(path: Path, line: bytes) -> None:
+    # Hand the full line to an unbuffered handle:
+    # one write() per record, no text-layer buffer in between.
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    with path.open("ab", buffering=0) as f:
+        f.write(line)
+
+
+def write_json(path: Path, data: Dict[str, Any], pretty: bool = False) -> None:
+    _write_bytes_atomic(path, dumps(data, pretty=pretty))
+
+
+def append_jsonl(path: Path, obj: Dict[str, Any]) -> None:
+    _append_line(path, dumps(obj, newline=True))
 
 
 def coerce_list(x: Any) -> List[Any]:
@@ -147,33 +172,40 @@ def status_snapshot() -> Dict[str, Any]:
     """
     raw = load_json(STATUS_FILE)
 
+    # bind each section once instead of re-fetching it per check
+    health = raw.get("health")
+    if not isinstance(health, dict):
+        health = None
+    guardian = raw.get("guardian")
+
     # metrics / autonomy sections
     metrics: Dict[str, Any] = {}
-    if isinstance(raw.get("health"), dict):
-        metrics = raw.get("health", {}).get("metrics", {}) if isinstance(raw.get("health", {}).get("metrics"), dict) else {}
-    elif isinstance(raw.get("metrics"), dict):
-        metrics = raw.get("metrics", {})
-
-    autonomy: Dict[str, Any] = raw.get("autonomy", {}) if isinstance(raw.get("autonomy"), dict) else {}
+    if health is not None:
+        health_metrics = health.get("metrics")
+        metrics = health_metrics if isinstance(health_metrics, dict) else {}
+    else:
+        raw_metrics = raw.get("metrics")
+        if isinstance(raw_metrics, dict):
+            metrics = raw_metrics
+
+    autonomy = raw.get("autonomy")
+    if not isinstance(autonomy, dict):
+        autonomy = {}
 
     # guardian status
-    guardian_status = None
-    if isinstance(raw.get("guardian"), dict):
-        guardian_status = raw.get("guardian", {}).get("status")
+    guardian_status = guardian.get("status") if isinstance(guardian, dict) else None
     if guardian_status is None:
         guardian_status = raw.get("guardian_status")
 
     # system health
-    system_health = None
-    if isinstance(raw.get("health"), dict):
-        system_health = raw.get("health", {}).get("overall_health")
+    system_health = health.get("overall_health") if health is not None else None
     if system_health is None:
         system_health = raw.get("system_health")
 
     return {
         "guardian_status": (str(guardian_status) if guardian_status is not None else "unknown"),
         "system_health": _norm_health(system_health),
-        "autonomy_level": autonomy.get("current_level") if isinstance(autonomy, dict) else None,
+        "autonomy_level": autonomy.get("current_level"),
         "raw": raw,
         "metrics": metrics or {},
     }
@@ -269,7 +301,7 @@ def build_decision(ev: Dict[str, Any], rule: Optional[Dict[str, Any]], snap: Dic
     decision: Dict[str, Any] = {
         "timestamp": now_iso(),
         "input_event": ev,
-        "rules_file": str(RULES_FILE.relative_to(REPO_ROOT)),
+        "rules_file": RULES_FILE_REL,
         "status_snapshot": {
             "guardian_status": snap.get("guardian_status"),
             "system_health": snap.get("system_health"),
@@ -281,14 +313,15 @@ def build_decision(ev: Dict[str, Any], rule: Optional[Dict[str, Any]], snap: Dic
     }
 
     if rule is None:
-        decision["selected_rule_id"] = None
         decision["action"] = {"type": "noop", "message": "No matching rule found (default noop)."}
         decision["allowed"] = True
         return decision
 
     decision["selected_rule_id"] = rule.get("id")
-    action = rule.get("action") or {}
-    decision["action"] = action if isinstance(action, dict) else {}
+    action = rule.get("action")
+    if not isinstance(action, dict):
+        action = {}
+    decision["action"] = action
 
     ok, reasons = preconditions_ok(rule, snap)
 
@@ -310,7 +343,7 @@ def build_decision(ev: Dict[str, Any], rule: Optional[Dict[str, Any]], snap: Dic
             "target_agent": "self_guardian",
             "intent": "review_blocked_action",
             "message": "Action blocked by GEORGE preconditions; routed to Self-Guardian for review.",
-            "original_action": action if isinstance(action, dict) else {},
+            "original_action": action,
         }
 
     return decision
@@ -331,7 +364,7 @@ def main() -> int:
         return 2
 
     try:
-        raw_event = json.loads(event_path.read_text(encoding="utf-8"))
+        raw_event = loads(event_path.read_bytes())
         if not isinstance(raw_event, dict):
             raise ValueError("event JSON must be an object/dict")
     except Exception as e:
@@ -360,8 +393,11 @@ def main() -> int:
     # persist
     try:
         DECISIONS_DIR.mkdir(parents=True, exist_ok=True)
-        write_json(LATEST_DECISION, decision)
-        append_jsonl(DECISIONS_LOG, decision)
+        # latest.json is read by the gate/API, not by people: write it compact,
+        # byte-identical to the log line, and encode the decision only once
+        payload = dumps(decision)
+        _write_bytes_atomic(LATEST_DECISION, payload)
+        _append_line(DECISIONS_LOG, payload + b"\n")
     except Exception as e:
         print(f"Failed to persist decisions: {e}", file=sys.stderr)
         return 1
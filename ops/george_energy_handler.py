@@ -1,7 +1,12 @@
 from datetime import datetime, timezone
-import json
+import os
 from pathlib import Path
 
+try:
+    from ops.jsonio import dumps
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import dumps
+
 
 def now_iso():
     return datetime.now(timezone.utc).isoformat()
@@ -10,15 +15,17 @@ def now_iso():
 def append_jsonl(path, obj):
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    with path.open("ab") as f:
+        f.write(dumps(obj, newline=True))
 
 
-def save_json(path, obj):
+def save_json(path, obj, pretty=False):
+    # latest.json is read by machines; pass pretty=True only for debugging
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(dumps(obj, pretty))
+    os.replace(tmp, path)
 
 
 def handle_energy_scan_completed(event):
@@ -6,18 +6,23 @@ GEORGE Orchestrator V1.0
 - Lädt Orchestrierungsregeln aus ops/rules/george_rules.yaml
 - Wendet passende Regeln an
 - Schreibt neue "GEORGE-Aktionen" als Events zurück nach ops/events.jsonl
+  (JSONL, eine Zeile pro Event, nur Append)
 
 Dieses Skript ist bewusst einfach gehalten:
 - verarbeitet immer nur das letzte Event
 - erzeugt pro zutreffender Regel genau ein Folge-Event
 """
 
-import datetime
 import json
+import os
 import pathlib
+import time
 from typing import Any, Dict, List, Optional
 
-import yaml  # PyYAML
+try:
+    from ops.jsonio import dumps, loads, read_last_line
+except ImportError:  # Skriptaufruf: ops/ selbst liegt auf sys.path
+    from jsonio import dumps, loads, read_last_line
 
 
 # Pfade relativ zum Repo-Root bestimmen
@@ -25,19 +30,29 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 EVENTS_FILE = ROOT / "ops" / "events.jsonl"
 RULES_FILE = ROOT / "ops" / "rules" / "george_rules.yaml"
 
+# Blockgröße für das Rückwärtslesen von events.jsonl
+TAIL_CHUNK_SIZE = 8192
+
 
 def now_iso() -> str:
     """UTC-Zeit als ISO-String (ohne Mikrosekunden)."""
-    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def load_rules() -> List[Dict[str, Any]]:
-    """Lädt die Orchestrierungsregeln aus george_rules.yaml."""
+    """Lädt die Orchestrierungsregeln aus george_rules.yaml.
+
+    PyYAML wird erst hier importiert (Läufe ohne Event brauchen es nie);
+    bevorzugt wird der libyaml-Parser (C).
+    """
     if not RULES_FILE.exists():
         raise FileNotFoundError(f"Rules file not found: {RULES_FILE}")
 
-    with RULES_FILE.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    import yaml  # PyYAML
+
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+    with RULES_FILE.open("rb") as f:
+        data = yaml.load(f, Loader=loader)
 
     rules = data.get("rules", [])
     if not isinstance(rules, list):
@@ -45,16 +60,12 @@ def load_rules() -> List[Dict[str, Any]]:
     return rules
 
 
-def load_latest_event() -> Optional[Dict[str, Any]]:
-    """Liest das letzte Event aus events.jsonl (JSON-Array)."""
-    if not EVENTS_FILE.exists():
-        return None
-
+def _load_latest_event_full() -> Optional[Dict[str, Any]]:
+    """Fallback: parst die komplette Datei (Legacy-Format als JSON-Array)."""
     try:
-        with EVENTS_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads(EVENTS_FILE.read_bytes())
     except json.JSONDecodeError:
-        print("Warnung: events.jsonl <ist kein gültiges JSON.")
+        print("Warnung: events.jsonl ist kein gültiges JSON.")
         return None
 
     if not isinstance(data, list) or not data:
@@ -63,6 +74,30 @@ def load_latest_event() -> Optional[Dict[str, Any]]:
     return data[-1]  # last event in Array
 
 
+def load_latest_event() -> Optional[Dict[str, Any]]:
+    """Liest das letzte Event aus events.jsonl (eine Zeile pro Event).
+
+    Nur die letzte Zeile wird gelesen und geparst. Ist sie kein gültiges
+    JSON-Objekt (z. B. altes Array-Format), wird die Datei komplett geladen.
+    """
+    if not EVENTS_FILE.exists():
+        return None
+
+    last_line = read_last_line(EVENTS_FILE, TAIL_CHUNK_SIZE)
+    if last_line is None:
+        return None
+
+    try:
+        event = loads(last_line)
+    except json.JSONDecodeError:
+        event = None
+
+    if isinstance(event, dict):
+        return event
+
+    return _load_latest_event_full()
+
+
 def _normalize_to_list(value: Any) -> List[Any]:
     """Hilfsfunktion: akzeptiert Single-Value oder Liste und gibt immer Liste zurück."""
     if value is None:
@@ -96,11 +131,23 @@ def rule_matches(event: Dict[str, Any], rule: Dict[str, Any]) -> bool:
 
 
 def build_follow_up_events(
-    source_event: Dict[str, Any], rules: List[Dict[str, Any]]
+    source_event: Dict[str, Any],
+    rules: List[Dict[str, Any]],
+    timestamp: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Erzeugt neue Events für alle Regeln, die auf das Source-Event matchen."""
+    """Erzeugt neue Events für alle Regeln, die auf das Source-Event matchen.
+
+    Alle Folge-Events eines Durchlaufs tragen denselben Zeitstempel
+    (einmal pro Aufruf bestimmt, optional vom Aufrufer übergeben).
+    """
 
     follow_ups: List[Dict[str, Any]] = []
+    ts = timestamp or now_iso()
+
+    # Schleifeninvarianten einmal binden (lokale statt globale/Attribut-Lookups)
+    source_agent = source_event.get("agent")
+    source_event_name = source_event.get("event")
+    append = follow_ups.append
 
     for rule in rules:
         if not rule_matches(source_event, rule):
@@ -116,49 +163,82 @@ def build_follow_up_events(
             continue
 
         follow_event: Dict[str, Any] = {
-            "timestamp": now_iso(),
+            "timestamp": ts,
             "agent": "george",  # GEORGE selbst
             "event": "route",
             "rule_id": rule.get("id"),
-            "source_agent": source_event.get("agent"),
-            "source_event": source_event.get("event"),
+            "source_agent": source_agent,
+            "source_event": source_event_name,
             "target_agent": target_agent,
             "intent": intent,
             "message": message,
         }
 
-        follow_ups.append(follow_event)
+        append(follow_event)
 
     return follow_ups
 
 
 def append_events(events: List[Dict[str, Any]]) -> None:
-    """Hängt neue Events an events.jsonl (JSON-Array) an."""
+    """Hängt neue Events an events.jsonl an (eine JSON-Zeile pro Event).
+
+    Reines Append – bestehende Einträge werden weder gelesen noch neu
+    geschrieben.
+    """
     if not events:
         return
 
-    existing: List[Dict[str, Any]] = []
-    if EVENTS_FILE.exists():
-        try:
-            with EVENTS_FILE.open("r", encoding="utf-8") as f:
-                existing = json.load(f)
-        except json.JSONDecodeError:
-            print("Warnung: Konnte bestehende events.jsonl nicht lesen – starte mit leerem Array.")
-            existing = []
+    # Alle Zeilen vorab kodieren und mit einem einzigen write() anhängen
+    payload = b"".join(dumps(ev, newline=True) for ev in events)
+    fd = os.open(EVENTS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
-    if not isinstance(existing, list):
-        existing = []
 
-    existing.extend(events)
+def migrate_events_json_to_jsonl(path: Optional[pathlib.Path] = None) -> int:
+    """Konvertiert ein Event-Log im alten JSON-Array-Format nach JSONL.
 
-    with EVENTS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(existing, f, ensure_ascii=False)
+    Einmalige Migration: liegt die Datei bereits als JSONL vor (oder fehlt
+    sie), passiert nichts. Gibt die Anzahl der migrierten Events zurück.
+    """
+    path = path or EVENTS_FILE
+    if not path.exists():
+        return 0
+
+    with path.open("rb") as f:
+        head = f.read(64).lstrip()
+    if not head.startswith(b"["):
+        return 0
+
+    try:
+        data = loads(path.read_bytes())
+    except json.JSONDecodeError:
+        print(f"Warnung: {path.name} ist kein gültiges JSON-Array – keine Migration.")
+        return 0
+
+    if not isinstance(data, list):
+        return 0
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.writelines(dumps(ev, newline=True) for ev in data)
+    tmp.replace(path)
+    return len(data)
 
 
 
 def main() -> None:
     print("GEORGE Orchestrator V1.0 starting…")
 
+    migrated = migrate_events_json_to_jsonl()
+    if migrated:
+        print(f"events.jsonl: {migrated} Event(s) aus JSON-Array nach JSONL migriert.")
+
     latest_event = load_latest_event()
     if not latest_event:
         print("Keine Events gefunden – nichts zu tun.")
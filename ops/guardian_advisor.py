@@ -14,12 +14,17 @@ Design goals:
 
 from __future__ import annotations
 
-import json
 import os
 import re
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
+try:
+    from ops.jsonio import dumps, loads
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import dumps, loads
+
+
 LATEST_PATH = os.environ.get("GEORGE_LATEST_PATH", "ops/decisions/latest.json")
 ADVICE_PATH = os.environ.get("GUARDIAN_ADVICE_PATH", "ops/decisions/guardian_advice.json")
 
@@ -31,15 +36,14 @@ def utc_now_iso() -> str:
 
 
 def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads(f.read())
 
 
 def save_json(path: str, data: Any) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    with open(path, "wb") as f:
+        f.write(dumps(data, pretty=True, newline=True))
 
 
 def normalize_latest(latest: Any) -> Dict[str, Any]:
@@ -77,6 +81,12 @@ SUSPICIOUS_PATTERNS = [
     r"\btoken\b",
 ]
 
+# Compiled once at import. `assess` lowercases its text, so no IGNORECASE needed.
+# The combined alternation answers the common "nothing suspicious" case in a
+# single scan; the per-pattern list is only consulted to count distinct hits.
+_SUSPICIOUS_RES = [re.compile(pat) for pat in SUSPICIOUS_PATTERNS]
+_SUSPICIOUS_ANY = re.compile("|".join(f"(?:{pat})" for pat in SUSPICIOUS_PATTERNS))
+
 HIGH_RISK_ACTIONS = {
     "deploy",
     "site-deploy",
@@ -107,9 +117,8 @@ def assess(decision: Dict[str, Any]) -> Tuple[str, float, str, list]:
 
     # pattern-based security heuristics
     hits = []
-    for pat in SUSPICIOUS_PATTERNS:
-        if re.search(pat, text, flags=re.IGNORECASE):
-            hits.append(pat)
+    if _SUSPICIOUS_ANY.search(text):
+        hits = [rx.pattern for rx in _SUSPICIOUS_RES if rx.search(text)]
 
     # action-based risk
     action_norm = str(action).strip().lower() if action is not None else ""
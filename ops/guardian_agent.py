@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 import argparse
-import json
+import atexit
 import os
 import re
 from dataclasses import dataclass
@@ -13,6 +13,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+try:  # optional: pyahocorasick scans a text for all messaging phrases in one pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from ops.jsonio import dumps, loads
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import dumps, loads
+
+
 POLICY_PATH = Path("ops/guardian_policy.json")
 
 TRACE_PATH = Path("ops/reports/guardian_trace.jsonl")
@@ -25,26 +36,32 @@ def utc_now() -> str:
 def ensure_parent(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
 
+# JSONL lines queued per path; written by flush_jsonl() (explicitly or at exit)
+_PENDING_JSONL: Dict[Path, List[bytes]] = {}
+
 def append_jsonl(path: Path, obj: dict) -> None:
-    ensure_parent(path)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    _PENDING_JSONL.setdefault(path, []).append(dumps(obj, newline=True))
+
+def flush_jsonl() -> None:
+    """One open + write per log file for everything queued since the last flush."""
+    while _PENDING_JSONL:
+        path, lines = _PENDING_JSONL.popitem()
+        ensure_parent(path)
+        with path.open("ab") as f:
+            f.write(b"".join(lines))
+
+atexit.register(flush_jsonl)
 
 def write_json(path: Path, obj: dict) -> None:
     ensure_parent(path)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    tmp.write_bytes(dumps(obj, pretty=True, newline=True))
     tmp.replace(path)
 
 def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="replace")
 
-def ci_contains(haystack: str, needle: str) -> bool:
-    return needle.lower() in haystack.lower()
-
-@dataclass
+@dataclass(slots=True)
 class Finding:
     severity: str  # "BLOCK" | "WARN"
     code: str
@@ -54,7 +71,7 @@ class Finding:
 def load_policy() -> Dict[str, Any]:
     if not POLICY_PATH.exists():
         raise FileNotFoundError(f"Missing policy file: {POLICY_PATH}")
-    return json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    return loads(POLICY_PATH.read_bytes())
 
 def check_truth_files(policy: Dict[str, Any]) -> List[Finding]:
     findings: List[Finding] = []
@@ -71,9 +88,11 @@ def check_truth_files(policy: Dict[str, Any]) -> List[Finding]:
             ))
     return findings
 
+# Looks for: const TRUTH_PATH = "/ops/reports/system_status.json";
+_TRUTH_PATH_RE = re.compile(r'const\s+TRUTH_PATH\s*=\s*"([^"]+)"\s*;')
+
 def extract_status_truth_path(status_html: str) -> str | None:
-    # Looks for: const TRUTH_PATH = "/ops/reports/system_status.json";
-    m = re.search(r'const\s+TRUTH_PATH\s*=\s*"([^"]+)"\s*;', status_html)
+    m = _TRUTH_PATH_RE.search(status_html)
     return m.group(1).strip() if m else None
 
 def check_status_truth_lock(policy: Dict[str, Any]) -> List[Finding]:
@@ -113,6 +132,17 @@ def check_status_truth_lock(policy: Dict[str, Any]) -> List[Finding]:
 
     return findings
 
+def build_phrase_automaton(phrases: List[str]):
+    """Aho-Corasick automaton over the lowercased phrases, or None without pyahocorasick."""
+    words = {p.lower() for p in phrases if p}
+    if ahocorasick is None or not words:
+        return None
+    automaton = ahocorasick.Automaton()
+    for w in words:
+        automaton.add_word(w, w)
+    automaton.make_automaton()
+    return automaton
+
 def check_messaging_controls(policy: Dict[str, Any]) -> List[Finding]:
     findings: List[Finding] = []
     mc = policy.get("messaging_controls", {})
@@ -124,6 +154,13 @@ def check_messaging_controls(policy: Dict[str, Any]) -> List[Finding]:
     avoid_hits: List[Tuple[str, str]] = []
     require_hits = {r: False for r in require}
 
+    # lowercase each phrase once (not per page); keep the original for messages
+    avoid_lc = [(phrase, phrase.lower()) for phrase in avoid]
+    require_lc = [(phrase, phrase.lower()) for phrase in require]
+    words_lc = {w for _, w in avoid_lc} | {w for _, w in require_lc}
+
+    automaton = build_phrase_automaton(list(words_lc))
+
     for p in scan_paths:
         if not p.exists():
             # Not blocking: some pages may not exist in all builds
@@ -135,16 +172,22 @@ def check_messaging_controls(policy: Dict[str, Any]) -> List[Finding]:
             ))
             continue
 
-        text = read_text(p)
-
-        # avoid phrase scan
-        for phrase in avoid:
-            if ci_contains(text, phrase):
+        # lowercase each page once, then collect every phrase it contains
+        text_lc = read_text(p).lower()
+        if automaton is not None:
+            # one linear pass over the text finds all phrases
+            found = {w for _, w in automaton.iter(text_lc)}
+        else:
+            found = {w for w in words_lc if w in text_lc}
+
+        # avoid phrase scan ("" is a substring of every page, as with `in`)
+        for phrase, phrase_lc in avoid_lc:
+            if not phrase_lc or phrase_lc in found:
                 avoid_hits.append((str(p), phrase))
 
         # require phrase scan
-        for phrase in require:
-            if not require_hits[phrase] and ci_contains(text, phrase):
+        for phrase, phrase_lc in require_lc:
+            if not phrase_lc or phrase_lc in found:
                 require_hits[phrase] = True
 
     # enforce avoid hits
@@ -247,6 +290,7 @@ def main() -> int:
         }
     }
     append_jsonl(ACTIVITY_PATH, activity_event)
+    flush_jsonl()
 
     # Hard exit code for governance: BLOCK => non-zero
     return 0 if verdict == "PASS" else 2
@@ -6,6 +6,11 @@ from pathlib import Path
 from typing import Any, Dict, List
 from datetime import datetime
 
+try:
+    from ops.jsonio import loads
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import loads
+
 # ============================================================
 # Phase 9 (SSOT Enforcement):
 # - This script MUST NOT write any authoritative status.
@@ -28,28 +33,48 @@ def load_json(path: Path, default: Any = None) -> Any:
     if not path.exists():
         return default
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return loads(path.read_bytes())
     except json.JSONDecodeError:
         return default
 
 
-def load_health_log(path: Path) -> List[Dict[str, Any]]:
+def _parse_jsonl(raw: bytes) -> List[Dict[str, Any]]:
+    # One value per line; malformed lines are skipped on their own
     records: List[Dict[str, Any]] = []
-    if not path.exists():
-        return records
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+    for line in raw.split(b"\n"):
+        if not line or line.isspace():
+            continue
+        try:
+            records.append(loads(line))
+        except ValueError:
+            continue
     return records
 
 
+def load_tail_records(path: Path, n: int = 40, window: int = 65536) -> List[Dict[str, Any]]:
+    """
+    Last n parseable records of a JSONL file, reading only its tail.
+    The window doubles until it holds n records or covers the whole file.
+    """
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        size = f.seek(0, 2)
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            chunk = f.read(size - start)
+            if start > 0:
+                # the first line may be cut off by the window
+                chunk = chunk[chunk.find(b"\n") + 1:] if b"\n" in chunk else b""
+            records = _parse_jsonl(chunk)
+            if len(records) >= n or start == 0:
+                return records[-n:]
+            window *= 2
+
+
 def pct_01(value: float) -> int:
     """Convert 0..1 floats to % int."""
     try:
@@ -139,7 +164,8 @@ def build_svg_autonomy(history: List[Dict[str, Any]], fallback_pct: int) -> str:
 def generate_dashboard() -> None:
     # READ-ONLY: load authoritative SSOT
     ssot: Dict[str, Any] = load_json(SSOT_FILE, default={}) or {}
-    history = load_health_log(HEALTH_LOG)
+    # chart uses the last 40 records, the table the last 20: parse only the tail
+    history = load_tail_records(HEALTH_LOG, n=40)
 
     # Use SSOT fields if available (robust to schema evolution)
     # If SSOT missing, we still generate a dashboard, but clearly reflects missing truth.
@@ -0,0 +1,61 @@
+"""
+Shared JSON helpers for the ops scripts.
+
+dumps/loads use orjson when it is installed and fall back to the stdlib json
+module otherwise. The fallback writes the same layout (compact separators, or
+2-space indent with pretty=True, UTF-8 without escaping) and stringifies
+non-str keys like OPT_NON_STR_KEYS does. Remaining differences: orjson writes
+NaN/Infinity as null where json writes NaN/Infinity, and orjson serialises
+datetime/dataclass values that json rejects.
+
+read_last_line reads the last record of an append-only JSONL file from EOF.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+
+    def dumps(obj: Any, pretty: bool = False, newline: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError / ValueError
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj: Any, pretty: bool = False, newline: bool = False) -> bytes:
+        if pretty:
+            text = json.dumps(obj, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        if newline:
+            text += "\n"
+        return text.encode("utf-8")
+
+    loads = json.loads
+
+
+def read_last_line(path: Union[str, "os.PathLike[str]"], chunk: int = 8192) -> Optional[bytes]:
+    """
+    Last non-empty line of a file (stripped), or None if there is none.
+    Reads a window from EOF that doubles until it holds a line break, so the
+    cost does not grow with the length of the log.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        window = min(size, chunk)
+        while True:
+            f.seek(size - window)
+            tail = f.read(window).rstrip()
+            idx = tail.rfind(b"\n")
+            if idx != -1 or window == size:
+                return tail[idx + 1:].strip() or None
+            window = min(size, window * 2)
@@ -8,11 +8,15 @@ Merge guardian advice into ops/decisions/latest.json
 
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict
 
+try:
+    from ops.jsonio import dumps, loads
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import dumps, loads
+
 
 LATEST_PATH = os.environ.get("GEORGE_LATEST_PATH", "ops/decisions/latest.json")
 ADVICE_PATH = os.environ.get("GUARDIAN_ADVICE_PATH", "ops/decisions/guardian_advice.json")
@@ -23,15 +27,14 @@ def utc_now_iso() -> str:
 
 
 def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads(f.read())
 
 
 def save_json(path: str, data: Any) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    with open(path, "wb") as f:
+        f.write(dumps(data, pretty=True, newline=True))
 
 
 def ensure_guardian_block(target: Dict[str, Any]) -> Dict[str, Any]:
@@ -51,6 +54,9 @@ def main() -> int:
         print(f"[merge_guardian_advice] Failed to read advice: {e}")
         return 0
 
+    # one timestamp for everything this run writes
+    now = utc_now_iso()
+
     try:
         latest = load_json(LATEST_PATH)
     except FileNotFoundError:
@@ -58,7 +64,7 @@ def main() -> int:
         latest = {
             "schema_version": "2.0",
             "decision_id": "uuid",
-            "timestamp": utc_now_iso(),
+            "timestamp": now,
             "agent": "system",
             "decision": "proceed",
             "status": "success",
@@ -71,17 +77,17 @@ def main() -> int:
     if isinstance(latest, dict):
         guardian = ensure_guardian_block(latest)
         guardian.update(advice)
-        guardian.setdefault("merged_at", utc_now_iso())
+        guardian.setdefault("merged_at", now)
         save_json(LATEST_PATH, latest)
         print("[merge_guardian_advice] merged advice into latest.json (dict schema).")
         return 0
 
     if isinstance(latest, list) and latest:
         if not isinstance(latest[-1], dict):
-            latest[-1] = {"timestamp": utc_now_iso(), "status": "unknown"}
+            latest[-1] = {"timestamp": now, "status": "unknown"}
         guardian = ensure_guardian_block(latest[-1])
         guardian.update(advice)
-        guardian.setdefault("merged_at", utc_now_iso())
+        guardian.setdefault("merged_at", now)
         save_json(LATEST_PATH, latest)
         print("[merge_guardian_advice] merged advice into latest.json (legacy list schema).")
         return 0
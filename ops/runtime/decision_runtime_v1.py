@@ -1,9 +1,29 @@
 import argparse
+import atexit
 import datetime
 import hashlib
 import json
 import os
-from typing import Any, Dict, Tuple
+import tempfile
+import threading
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+
+# -----------------------------
+# Static contract scaffolding
+# -----------------------------
+
+USE_CASE = "energy_peak_mitigation"
+CONSTRAINTS_APPLIED = (
+    "geo_station_protected",
+    "quality_over_cost",
+    "takt_stability_required",
+    "advisory_only",
+)
+ALLOWED_EXECUTION_MODES = ("PROPOSE_ONLY",)
+
+TRACE_JSON_PATH = "ops/reports/decision_trace.json"
+TRACE_JSONL_PATH = "ops/reports/decision_trace.jsonl"
 
 
 # -----------------------------
@@ -19,16 +39,129 @@ def load_json(path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
-def save_json(path: str, data: Dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+# Directories created by this process (absolute paths); later writes skip mkdir.
+_ENSURED_DIRS: set[str] = set()
+
 
-
-def append_trace(path: str, record: Dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+def _ensure_parent(path: str) -> None:
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent not in _ENSURED_DIRS:
+        os.makedirs(parent, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+
+
+# os.umask can only be read by setting it; do that once here, not per write
+# from concurrent threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    # temp file + os.replace: readers (API, gate) never see a half-written artifact
+    # unique temp name per call: the API endpoints run run_decision concurrently
+    _ensure_parent(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=os.path.basename(path) + ".")
+    try:
+        # mkstemp creates 0600; keep the target's mode, or what open() would give
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# Append-only logs stay open for the life of the process (the API server runs
+# many decisions); each append is flushed so readers always see whole records.
+_APPEND_HANDLES: Dict[str, BinaryIO] = {}
+_APPEND_LOCK = threading.Lock()
+
+
+def _append_bytes(path: str, payload: bytes) -> None:
+    path = os.path.abspath(path)
+    with _APPEND_LOCK:
+        f = _APPEND_HANDLES.get(path)
+        if f is None:
+            _ensure_parent(path)
+            f = _APPEND_HANDLES[path] = open(path, "ab")
+        f.write(payload)
+        f.flush()
+
+
+def close_append_handles() -> None:
+    with _APPEND_LOCK:
+        for f in _APPEND_HANDLES.values():
+            f.close()
+        _APPEND_HANDLES.clear()
+
+
+atexit.register(close_append_handles)
+
+
+class WriteBatch:
+    """
+    Collects the file writes of one decision run and performs them in a single
+    flush: every target path is opened once and written with one write() call.
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple[str, str, bytes]] = []
+
+    def add(self, path: str, mode: str, payload: bytes) -> None:
+        self._pending.append((path, mode, payload))
+
+    def flush(self) -> None:
+        grouped: Dict[str, Tuple[str, List[bytes]]] = {}
+        for path, mode, payload in self._pending:
+            if path in grouped and mode == "w":
+                # a later full write supersedes anything queued before it
+                grouped[path] = ("w", [payload])
+            elif path in grouped:
+                grouped[path][1].append(payload)
+            else:
+                grouped[path] = (mode, [payload])
+        self._pending.clear()
+
+        for path, (mode, chunks) in grouped.items():
+            if mode == "a":
+                _append_bytes(path, b"".join(chunks))
+                continue
+            _atomic_write(path, b"".join(chunks))
+
+
+def dump_json(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def save_json(
+    path: str,
+    data: Dict[str, Any],
+    batch: Optional[WriteBatch] = None,
+    pretty: bool = False,
+) -> None:
+    payload = dump_json(data, pretty)
+    if batch is not None:
+        batch.add(path, "w", payload)
+        return
+    _atomic_write(path, payload)
+
+
+def append_trace(path: str, record: Dict[str, Any], batch: Optional[WriteBatch] = None) -> None:
+    payload = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    if batch is not None:
+        batch.add(path, "a", payload)
+        return
+    _append_bytes(path, payload)
 
 
 def stable_hash(data: Dict[str, Any]) -> str:
@@ -40,13 +173,13 @@ def stable_hash(data: Dict[str, Any]) -> str:
 # Context Builder
 # -----------------------------
 
-def build_context(event: Dict[str, Any]) -> Dict[str, Any]:
+def build_context(event: Dict[str, Any], ts: Optional[str] = None) -> Dict[str, Any]:
     event_hash = stable_hash(event)
     return {
         "line_id": event["line_id"],
         "time_window": event["time_window"],
         "state_hash": event_hash,
-        "snapshot_time": now(),
+        "snapshot_time": ts or now(),
     }
 
 
@@ -54,10 +187,14 @@ def build_context(event: Dict[str, Any]) -> Dict[str, Any]:
 # Decision Contract
 # -----------------------------
 
-def create_decision_contract(event: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+def create_decision_contract(
+    event: Dict[str, Any],
+    context: Dict[str, Any],
+    ts: Optional[str] = None,
+) -> Dict[str, Any]:
     decision_suffix = stable_hash(
         {
-            "use_case": "energy_peak_mitigation",
+            "use_case": USE_CASE,
             "line_id": context["line_id"],
             "time_window": context["time_window"],
             "inputs": event,
@@ -70,7 +207,7 @@ def create_decision_contract(event: Dict[str, Any], context: Dict[str, Any]) ->
     return {
         "decision_id": decision_id,
         "trace_id": trace_id,
-        "use_case": "energy_peak_mitigation",
+        "use_case": USE_CASE,
         "intent": "reduce_peak_energy_cost",
         "scope": {
             "line_id": context["line_id"],
@@ -81,12 +218,7 @@ def create_decision_contract(event: Dict[str, Any], context: Dict[str, Any]) ->
             "snapshot_time": context["snapshot_time"],
         },
         "inputs": event,
-        "constraints_applied": [
-            "geo_station_protected",
-            "quality_over_cost",
-            "takt_stability_required",
-            "advisory_only",
-        ],
+        "constraints_applied": list(CONSTRAINTS_APPLIED),
         "candidate_action": {
             "type": "delay_stage_groups",
             "targets": event["candidate_shiftable_stages"],
@@ -97,7 +229,7 @@ def create_decision_contract(event: Dict[str, Any], context: Dict[str, Any]) ->
         "risk_class": "low",
         "decision_class": "operational",
         "execution_mode": "PROPOSE_ONLY",
-        "created_at": now(),
+        "created_at": ts or now(),
     }
 
 
@@ -105,13 +237,13 @@ def create_decision_contract(event: Dict[str, Any], context: Dict[str, Any]) ->
 # Authority Resolver (minimal)
 # -----------------------------
 
-def resolve_authority(contract: Dict[str, Any]) -> Dict[str, Any]:
+def resolve_authority(contract: Dict[str, Any], ts: Optional[str] = None) -> Dict[str, Any]:
     return {
         "owner": contract["authority_scope"],
         "veto": contract["veto_scope"],
-        "allowed_execution_modes": ["PROPOSE_ONLY"],
+        "allowed_execution_modes": list(ALLOWED_EXECUTION_MODES),
         "authority_ok": True,
-        "resolved_at": now(),
+        "resolved_at": ts or now(),
     }
 
 
@@ -149,6 +281,7 @@ def build_result(
     authority: Dict[str, Any],
     gate_verdict: str,
     reason: str,
+    ts: Optional[str] = None,
 ) -> Dict[str, Any]:
     if gate_verdict == "ALLOW_ADVISORY":
         lifecycle_status = "completed"
@@ -174,7 +307,7 @@ def build_result(
         "execution_mode": contract["execution_mode"],
         "line_id": contract["scope"]["line_id"],
         "time_window": contract["scope"]["time_window"],
-        "emitted_at": now(),
+        "emitted_at": ts or now(),
     }
 
 
@@ -182,11 +315,16 @@ def build_result(
 # Trace Writer
 # -----------------------------
 
-def write_trace(contract: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+def write_trace(
+    contract: Dict[str, Any],
+    result: Dict[str, Any],
+    batch: Optional[WriteBatch] = None,
+    ts: Optional[str] = None,
+) -> Dict[str, Any]:
     record = {
         "trace_id": contract["trace_id"],
         "decision_id": contract["decision_id"],
-        "timestamp": now(),
+        "timestamp": ts or now(),
         "use_case": contract["use_case"],
         "decision_class": contract["decision_class"],
         "line_id": contract["scope"]["line_id"],
@@ -199,8 +337,13 @@ def write_trace(contract: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, A
         "execution_mode": contract["execution_mode"],
     }
 
-    append_trace("ops/reports/decision_trace.jsonl", record)
-    save_json("ops/reports/decision_trace.json", record)
+    # the .json snapshot and the .jsonl line carry the same record: encode once
+    payload = dump_json(record)
+    target = batch if batch is not None else WriteBatch()
+    target.add(TRACE_JSONL_PATH, "a", payload + b"\n")
+    target.add(TRACE_JSON_PATH, "w", payload)
+    if batch is None:
+        target.flush()
     return record
 
 
@@ -210,22 +353,28 @@ def write_trace(contract: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, A
 
 def run_decision(input_path: str) -> Dict[str, Any]:
     event = load_json(input_path)
+    # one timestamp for the whole run; all artifacts of a decision share it
+    ts = now()
 
-    context = build_context(event)
-    contract = create_decision_contract(event, context)
-    authority = resolve_authority(contract)
+    context = build_context(event, ts)
+    contract = create_decision_contract(event, context, ts)
+    authority = resolve_authority(contract, ts)
     gate_verdict, reason = evaluate_gate(contract)
-    result = build_result(contract, authority, gate_verdict, reason)
-    trace_record = write_trace(contract, result)
+    result = build_result(contract, authority, gate_verdict, reason, ts)
+
+    batch = WriteBatch()
+    trace_record = write_trace(contract, result, batch, ts)
 
     contract_path = f"ops/decisions/contracts/{contract['decision_id']}.json"
     result_path = f"ops/decisions/results/{contract['decision_id']}.json"
     latest_path = "ops/decisions/latest.json"
     gate_path = "ops/decisions/gate_result.json"
 
-    save_json(contract_path, contract)
-    save_json(result_path, result)
-    save_json(latest_path, result)
+    save_json(contract_path, contract, batch)
+    # latest.json is a copy of the result file: encode once, write both
+    result_payload = dump_json(result)
+    batch.add(result_path, "w", result_payload)
+    batch.add(latest_path, "w", result_payload)
     save_json(
         gate_path,
         {
@@ -233,9 +382,11 @@ def run_decision(input_path: str) -> Dict[str, Any]:
             "trace_id": contract["trace_id"],
             "gate_verdict": gate_verdict,
             "reason": reason,
-            "written_at": now(),
+            "written_at": ts,
         },
+        batch,
     )
+    batch.flush()
 
     return {
         "contract": contract,
@@ -251,8 +402,8 @@ def run_decision(input_path: str) -> Dict[str, Any]:
             "result_path": result_path,
             "latest_path": latest_path,
             "gate_path": gate_path,
-            "trace_json_path": "ops/reports/decision_trace.json",
-            "trace_jsonl_path": "ops/reports/decision_trace.jsonl",
+            "trace_json_path": TRACE_JSON_PATH,
+            "trace_jsonl_path": TRACE_JSONL_PATH,
         },
     }
 
@@ -21,8 +21,11 @@ try:
 except ImportError:
     yaml = None
 
+# libyaml C loader when available, else the pure-Python safe loader
+_YamlLoader = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
 
-@dataclass
+
+@dataclass(slots=True)
 class GateResult:
     verdict: str  # ALLOW | BLOCK | ESCALATE
     reasons: List[str]
@@ -31,19 +34,34 @@ class GateResult:
     todo: List[str]
 
 
+# Pipeline exit code per verdict (anything unknown is treated as BLOCK)
+EXIT_CODES: Dict[str, int] = {"ALLOW": 0, "ESCALATE": 10, "BLOCK": 20}
+
+# Normalized (strip().lower()) string spellings accepted as booleans
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "ok"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n"})
+
+# Guardian status values (strip().upper()) that mean "not OK"
+_GUARDIAN_NOT_OK = frozenset({"WARNING", "FAIL", "FAILED", "ERROR"})
+
+# Verdicts a failing check may resolve to
+_FAIL_VERDICTS = frozenset({"BLOCK", "ESCALATE"})
+
+
 # -----------------------------
 # IO helpers
 # -----------------------------
 def _load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # one read() of the whole (small) file; json.loads detects UTF-8 on bytes
+    with open(path, "rb") as f:
+        return json.loads(f.read())
 
 
 def _load_yaml(path: str) -> Dict[str, Any]:
     if yaml is None:
         raise RuntimeError("PyYAML not installed. Add `pyyaml` to requirements.txt.")
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def _get(d: Any, key_path: str, default=None):
@@ -74,9 +92,9 @@ def _as_bool(v: Any) -> Optional[bool]:
         return bool(v)
     if isinstance(v, str):
         s = v.strip().lower()
-        if s in ("true", "1", "yes", "y", "ok"):
+        if s in _TRUE_STRINGS:
             return True
-        if s in ("false", "0", "no", "n"):
+        if s in _FALSE_STRINGS:
             return False
     return None
 
@@ -144,7 +162,7 @@ def _extract_guardian_ok(decision: Dict[str, Any]) -> Tuple[Optional[bool], Opti
                 s = raw.strip().upper()
                 if s == "OK":
                     return True, path
-                if s in ("WARNING", "FAIL", "FAILED", "ERROR"):
+                if s in _GUARDIAN_NOT_OK:
                     return False, path
         b = _as_bool(raw)
         if b is not None:
@@ -201,7 +219,7 @@ def _extract_trace_present(decision: Dict[str, Any]) -> Tuple[Optional[bool], Op
             if isinstance(raw, str) and raw.strip():
                 return True, path
         if isinstance(raw, dict):
-            return (True if len(raw.keys()) > 0 else False), path
+            return bool(raw), path
         b = _as_bool(raw)
         if b is not None:
             return b, path
@@ -287,8 +305,8 @@ def evaluate(decision: Dict[str, Any], policy: Dict[str, Any]) -> GateResult:
         verdict = "ALLOW"
     else:
         # Normalize on_fail
-        if on_fail not in ("BLOCK", "ESCALATE"):
-            on_fail = default_action if default_action in ("BLOCK", "ESCALATE") else "BLOCK"
+        if on_fail not in _FAIL_VERDICTS:
+            on_fail = default_action if default_action in _FAIL_VERDICTS else "BLOCK"
 
         # If policy demands ESCALATE but overrides not allowed -> BLOCK
         if on_fail == "ESCALATE" and not allow_override:
@@ -305,12 +323,7 @@ def evaluate(decision: Dict[str, Any], policy: Dict[str, Any]) -> GateResult:
         todo.append("Advisory mode: review required; no hard block will be enforced.")
 
     # Determine exit code (pipeline behavior)
-    if verdict == "ALLOW":
-        exit_code = 0
-    elif verdict == "ESCALATE":
-        exit_code = 10
-    else:
-        exit_code = 20
+    exit_code = EXIT_CODES.get(verdict, 20)
 
     applied = {
         "mode": mode,
@@ -363,7 +376,8 @@ def main():
         out = {
             "schema_version": "1.0",
             "decision_id": decision.get("decision_id") or decision.get("id"),
-            "decision_class": decision.get("decision_class") or decision.get("decisionClass") or decision.get("class"),
+            # resolved once in evaluate() (including the decisionClass/class aliases)
+            "decision_class": result.applied_policy.get("decision_class"),
             "verdict": result.verdict,
             "exit_code": result.exit_code,
             "reasons": result.reasons,
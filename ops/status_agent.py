@@ -27,11 +27,16 @@ Gate semantics (like Guardian PASS/BLOCK):
 from __future__ import annotations
 
 import argparse
-import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    from ops.jsonio import dumps, loads
+except ImportError:  # run as a script: ops/ itself is on sys.path
+    from jsonio import dumps, loads
+
 
 TRUTH_PATH = Path("ops/reports/system_status.json")
 DECISION_TRACE_JSON = Path("ops/reports/decision_trace.json")
@@ -58,7 +63,7 @@ def iso_utc_now() -> str:
 
 def load_json(path: Path) -> Dict[str, Any] | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return loads(path.read_bytes())
     except FileNotFoundError:
         return None
     except Exception:
@@ -72,13 +77,46 @@ def ensure_parent(path: Path) -> None:
 
 def append_jsonl(path: Path, obj: Dict[str, Any]) -> None:
     ensure_parent(path)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    with path.open("ab") as f:
+        f.write(dumps(obj, newline=True))
 
 
 def write_json(path: Path, obj: Dict[str, Any]) -> None:
+    """
+    Atomic write: temp file + os.replace, so readers (website mirror, gates)
+    never see a torn truth file if the run is interrupted mid-write.
+    """
     ensure_parent(path)
-    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(dumps(obj, pretty=True, newline=True))
+    os.replace(tmp, path)
+
+
+def emergency_lock_active(path: Path = EMERGENCY_LOCK_PATH) -> bool:
+    """
+    True only if the lock file exists and says {"locked": true}.
+    A missing or empty file is answered by a single stat() without reading it.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return False
+    if st.st_size == 0:
+        return False
+    # raw fd read: the lock file is tiny, no need for a buffered file object
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        raw = os.read(fd, st.st_size + 1)
+    finally:
+        os.close(fd)
+    try:
+        data = loads(raw)
+    except Exception:
+        data = None  # malformed lock file counts as "not locked", as in load_json
+    return isinstance(data, dict) and bool(data.get("locked", False))
 
 
 def compute_autonomy_percent(autonomy: Dict[str, Any] | None) -> float:
@@ -101,10 +139,11 @@ def file_evidence(path: Path) -> Dict[str, Any]:
     Deterministic file evidence: existence + size + mtime (UTC ISO).
     No content parsing required (keeps runtime safe and dependency-free).
     """
-    if not path.exists():
+    try:
+        st = path.stat()  # one syscall answers both "present?" and size/mtime
+    except (FileNotFoundError, NotADirectoryError):
         return {"present": False, "path": str(path)}
 
-    st = path.stat()
     mtime = (
         datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
         .replace(microsecond=0)
@@ -163,11 +202,11 @@ def load_registry_agents_minimal(path: Path) -> List[Dict[str, Any]]:
     - list items introduced by '-'
     - simple 'key: value' pairs (no nested dicts required for our use)
     """
-    if not path.exists():
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
         return []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-
     in_agents = False
     current: Optional[Dict[str, Any]] = None
     agents: List[Dict[str, Any]] = []
@@ -267,8 +306,7 @@ def main() -> int:
     mode = "SUPERVISED"
 
     # Gate semantics: emergency lock => BLOCK (like Guardian).
-    emergency_lock = load_json(EMERGENCY_LOCK_PATH) or {}
-    locked = bool(emergency_lock.get("locked", False))
+    locked = emergency_lock_active()
     gate_verdict = "BLOCK" if locked else "PASS"
 
     trace_prefix = f"trc_{ts.replace('-', '').replace(':', '').replace('T', '_').replace('Z','')}"
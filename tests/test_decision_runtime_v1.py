@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+
+from ops.runtime import decision_runtime_v1 as runtime
+
+
+def energy_event():
+    return {
+        "line_id": "BIW-TVL",
+        "time_window": "2026-01-12T10:00/11:00",
+        "quality_posture": "ok",
+        "oee_posture": "ok",
+        "buffer_fill_level": 5,
+        "candidate_shiftable_stages": ["stage_1", "stage_2"],
+        "energy_price_tier": "high",
+    }
+
+
+def test_write_batch_groups_writes_per_path(tmp_path):
+    log_path = str(tmp_path / "reports" / "trace.jsonl")
+    json_path = str(tmp_path / "reports" / "trace.json")
+
+    batch = runtime.WriteBatch()
+    runtime.append_trace(log_path, {"n": 1}, batch)
+    runtime.append_trace(log_path, {"n": 2}, batch)
+    runtime.save_json(json_path, {"n": 1}, batch)
+    runtime.save_json(json_path, {"n": 2}, batch)
+
+    assert not (tmp_path / "reports").exists()
+    batch.flush()
+
+    lines = (tmp_path / "reports" / "trace.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"n": 1}, {"n": 2}]
+    assert json.loads((tmp_path / "reports" / "trace.json").read_text(encoding="utf-8")) == {"n": 2}
+
+
+def test_save_json_keeps_regular_file_mode(tmp_path):
+    new_path = tmp_path / "latest.json"
+    runtime.save_json(str(new_path), {"n": 1})
+    assert new_path.stat().st_mode & 0o777 == 0o666 & ~runtime._UMASK
+
+    existing = tmp_path / "gate_result.json"
+    existing.write_bytes(b"{}")
+    os.chmod(existing, 0o640)
+    runtime.save_json(str(existing), {"n": 2})
+    assert existing.stat().st_mode & 0o777 == 0o640
+    assert json.loads(existing.read_bytes()) == {"n": 2}
+
+
+def test_run_decision_writes_all_artifacts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_path = tmp_path / "event.json"
+    input_path.write_text(json.dumps(energy_event()), encoding="utf-8")
+
+    output = runtime.run_decision(str(input_path))
+
+    assert output["result"]["gate_verdict"] == "ALLOW_ADVISORY"
+    for path in output["artifacts"].values():
+        assert (tmp_path / path).is_file()
+
+    latest = json.loads((tmp_path / output["artifacts"]["latest_path"]).read_text(encoding="utf-8"))
+    assert latest == output["result"]
+
+
+def test_run_decision_reuses_trace_log_handle(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_path = tmp_path / "event.json"
+    input_path.write_text(json.dumps(energy_event()), encoding="utf-8")
+
+    runtime.close_append_handles()
+    try:
+        runtime.run_decision(str(input_path))
+        handles = dict(runtime._APPEND_HANDLES)
+        runtime.run_decision(str(input_path))
+        assert runtime._APPEND_HANDLES == handles
+
+        lines = (tmp_path / "ops/reports/decision_trace.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+    finally:
+        runtime.close_append_handles()
+
+
+def test_write_trace_json_and_jsonl_carry_same_record(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_path = tmp_path / "event.json"
+    input_path.write_text(json.dumps(energy_event()), encoding="utf-8")
+
+    runtime.close_append_handles()
+    try:
+        output = runtime.run_decision(str(input_path))
+    finally:
+        runtime.close_append_handles()
+
+    snapshot = (tmp_path / runtime.TRACE_JSON_PATH).read_text(encoding="utf-8")
+    last_line = (tmp_path / runtime.TRACE_JSONL_PATH).read_text(encoding="utf-8").splitlines()[-1]
+    assert last_line == snapshot
+    assert json.loads(snapshot) == output["trace"]
+    assert output["trace"]["constraints_applied"] == list(runtime.CONSTRAINTS_APPLIED)
+
+
+def test_concurrent_run_decision_does_not_clobber_temp_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_path = tmp_path / "event.json"
+    input_path.write_text(json.dumps(energy_event()), encoding="utf-8")
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(25):
+                runtime.run_decision(str(input_path))
+        except Exception as exc:  # pragma: no cover - only hit on regression
+            errors.append(exc)
+
+    runtime.close_append_handles()
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        runtime.close_append_handles()
+
+    assert errors == []
+    reports = tmp_path / "ops" / "reports"
+    assert json.loads((tmp_path / runtime.TRACE_JSON_PATH).read_text(encoding="utf-8"))["use_case"]
+    assert not [p.name for p in reports.iterdir() if p.suffix not in (".json", ".jsonl")]
@@ -0,0 +1,125 @@
+# tests/test_george_orchestrator.py
+"""
+Tests für GEORGE Orchestrator V1 – Event-Log (events.jsonl) & Regel-Routing.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+import ops.george_orchestrator as george
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def events_file(tmp_path, monkeypatch) -> Path:
+    path = tmp_path / "events.jsonl"
+    monkeypatch.setattr(george, "EVENTS_FILE", path)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Tests: load_latest_event
+# ---------------------------------------------------------------------------
+
+def test_load_latest_event_missing_file_returns_none(events_file: Path) -> None:
+    assert george.load_latest_event() is None
+
+
+def test_load_latest_event_reads_last_jsonl_line(events_file: Path, monkeypatch) -> None:
+    lines = [json.dumps({"agent": "monitoring", "event": f"tick-{i}"}) for i in range(500)]
+    events_file.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+    # Kleiner Block erzwingt mehrere Rückwärts-Reads
+    monkeypatch.setattr(george, "TAIL_CHUNK_SIZE", 64)
+
+    latest = george.load_latest_event()
+    assert latest == {"agent": "monitoring", "event": "tick-499"}
+
+
+def test_load_latest_event_single_line_without_newline(events_file: Path) -> None:
+    events_file.write_text(json.dumps({"agent": "guardian", "event": "error"}), encoding="utf-8")
+    assert george.load_latest_event() == {"agent": "guardian", "event": "error"}
+
+
+def test_load_latest_event_legacy_array_fallback(events_file: Path) -> None:
+    legacy = [
+        {"agent": "system", "event": "bootstrap"},
+        {"agent": "content", "event": "content_ready"},
+    ]
+    events_file.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+    assert george.load_latest_event() == {"agent": "content", "event": "content_ready"}
+
+
+# ---------------------------------------------------------------------------
+# Tests: append_events / Migration
+# ---------------------------------------------------------------------------
+
+def test_append_events_appends_jsonl_lines(events_file: Path) -> None:
+    events_file.write_text(json.dumps({"agent": "system", "event": "bootstrap"}) + "\n", encoding="utf-8")
+
+    george.append_events([{"agent": "george", "event": "route", "message": "Grüße"}])
+    george.append_events([{"agent": "george", "event": "route", "rule_id": "r2"}])
+
+    lines = events_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["bootstrap", "route", "route"]
+    assert george.load_latest_event() == {"agent": "george", "event": "route", "rule_id": "r2"}
+
+
+def test_migrate_events_json_to_jsonl_converts_array(events_file: Path) -> None:
+    legacy = [
+        {"agent": "system", "event": "bootstrap"},
+        {"agent": "content", "event": "content_ready"},
+    ]
+    events_file.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    assert george.migrate_events_json_to_jsonl() == 2
+    lines = events_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == legacy
+
+    # Zweiter Aufruf ist ein No-Op
+    assert george.migrate_events_json_to_jsonl() == 0
+    assert events_file.read_text(encoding="utf-8").splitlines() == lines
+
+
+# ---------------------------------------------------------------------------
+# Tests: build_follow_up_events
+# ---------------------------------------------------------------------------
+
+RULES = [
+    {
+        "id": "guard-001",
+        "match": {"agent": "guardian", "event": "error"},
+        "action": {"target_agent": "self_guardian", "intent": "investigate_failure"},
+    },
+    {
+        "id": "guard-002",
+        "match": {"agent": ["guardian", "monitoring"]},
+        "action": {"target_agent": "george", "intent": "escalate"},
+    },
+    {
+        "id": "content-001",
+        "match": {"agent": "content", "event": "content_ready"},
+        "action": {"target_agent": "deploy", "intent": "publish"},
+    },
+]
+
+
+def test_build_follow_up_events_share_one_timestamp() -> None:
+    follow_ups = george.build_follow_up_events(
+        {"agent": "guardian", "event": "error"}, RULES, timestamp="2026-01-01T00:00:00Z"
+    )
+
+    assert [ev["rule_id"] for ev in follow_ups] == ["guard-001", "guard-002"]
+    assert {ev["timestamp"] for ev in follow_ups} == {"2026-01-01T00:00:00Z"}
+
+
+def test_now_iso_format() -> None:
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", george.now_iso())
@@ -0,0 +1,72 @@
+import pytest
+
+from ops.george import run
+
+
+RULES = [
+    {"id": "guard", "match": {"event": ["error", "failed"]}, "action": {"target_agent": "self_guardian"}},
+    {"id": "content", "match": {"agent": "content", "event": "content_ready"}, "action": {"target_agent": "deploy"}},
+    {"id": "monitor", "match": {"agent": ["monitoring", "guardian"]}, "action": {"target_agent": "george"}},
+    {"id": "broken", "match": "not-a-dict"},
+    {"id": "fallback", "match": {}, "action": {"type": "log"}},
+]
+
+
+@pytest.mark.parametrize(
+    "agent,event,expected",
+    [
+        ("content", "error", "guard"),
+        ("content", "content_ready", "content"),
+        ("content", "heartbeat", "fallback"),
+        ("guardian", "heartbeat", "monitor"),
+        ("unknown", "unknown", "fallback"),
+    ],
+)
+def test_select_rule_first_match(agent, event, expected):
+    ev = {"agent": agent, "event": event}
+    assert run.select_rule(RULES, ev)["id"] == expected
+
+
+def test_select_rule_without_catch_all():
+    rules = RULES[:3]
+    assert run.select_rule(rules, {"agent": "deploy", "event": "heartbeat"}) is None
+
+
+def test_select_rule_sees_in_place_rule_changes():
+    rules = [dict(r) for r in RULES]
+    ev = {"agent": "content", "event": "content_ready"}
+    assert run.select_rule(rules, ev)["id"] == "content"
+    rules.insert(0, {"id": "first", "match": {"agent": "content"}})
+    assert run.select_rule(rules, ev)["id"] == "first"
+
+
+@pytest.mark.parametrize("event_file", sorted((run.REPO_ROOT / "ops" / "george" / "tests").glob("*.json")), ids=lambda p: p.name)
+def test_select_rule_fixture_events(event_file):
+    rules = run.load_yaml(run.RULES_FILE)["rules"]
+    ev = run.normalize_event(run.load_json(event_file))
+    rule = run.select_rule(rules, ev)
+    earlier = rules if rule is None else rules[: rules.index(rule)]
+    assert not any(run.matches(r, ev) for r in earlier)
+    assert rule is None or run.matches(rule, ev)
+
+
+def test_build_decision_noop_without_rule():
+    ev = run.normalize_event({"agent": "x", "event": "y"})
+    decision = run.build_decision(ev, None, {"guardian_status": "green", "system_health": 0.9})
+    assert decision["selected_rule_id"] is None
+    assert decision["action"]["type"] == "noop"
+    assert decision["allowed"] is True
+
+
+def test_build_decision_blocked_keeps_original_action():
+    ev = run.normalize_event({"agent": "x", "event": "y"})
+    rule = {
+        "id": "r1",
+        "action": {"target_agent": "deploy"},
+        "preconditions": {"guardian_status": ["green"], "require_human_override": True},
+    }
+    decision = run.build_decision(ev, rule, {"guardian_status": "red", "system_health": 0.9})
+    assert decision["allowed"] is False
+    assert len(decision["blocked_reasons"]) == 2
+    assert decision["action"]["type"] == "hold"
+    assert decision["action"]["original_action"] == {"target_agent": "deploy"}
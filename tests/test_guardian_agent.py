@@ -0,0 +1,77 @@
+import types
+
+import pytest
+
+from ops import guardian_agent as guardian
+
+
+class StubAutomaton:
+    """Minimal stand-in for ahocorasick.Automaton: iter() yields (end_index, value) per occurrence."""
+
+    def __init__(self):
+        self.words = {}
+        self.built = False
+
+    def add_word(self, key, value):
+        self.words[key] = value
+
+    def make_automaton(self):
+        self.built = True
+
+    def iter(self, text):
+        assert self.built
+        for key, value in self.words.items():
+            start = text.find(key)
+            while start != -1:
+                yield start + len(key) - 1, value
+                start = text.find(key, start + 1)
+
+
+@pytest.fixture
+def policy(tmp_path):
+    (tmp_path / "index.html").write_text("<h1>The Industrial AI Platform</h1> Fully Autonomous!", encoding="utf-8")
+    (tmp_path / "about.html").write_text("governed autonomy, human in the loop", encoding="utf-8")
+    return {
+        "messaging_controls": {
+            "scan_paths": [str(tmp_path / "index.html"), str(tmp_path / "about.html"), str(tmp_path / "missing.html")],
+            "avoid_phrases_case_insensitive": ["fully autonomous", "AI Platform", "ai platform", "", "magic"],
+            "require_phrases_anywhere_case_insensitive": ["Human in the Loop", "audit trail", ""],
+        },
+        "enforcement": {"block_on_missing_required_phrases": True},
+    }
+
+
+def _run(policy):
+    return [(f.severity, f.code, f.message, f.path) for f in guardian.check_messaging_controls(policy)]
+
+
+def test_messaging_controls_fallback_scan(policy, monkeypatch):
+    monkeypatch.setattr(guardian, "ahocorasick", None)
+    findings = _run(policy)
+
+    assert [code for _, code, _, _ in findings] == [
+        "SCAN_PATH_MISSING",
+        "MESSAGING_AVOID_PHRASE",
+        "MESSAGING_REQUIRED_MISSING",
+    ]
+    avoid_msg = findings[1][2]
+    assert "contains 'fully autonomous'" in avoid_msg
+    assert "contains 'AI Platform'" in avoid_msg and "contains 'ai platform'" in avoid_msg
+    assert "magic" not in avoid_msg
+    # an empty phrase is a substring of every page, as with `in`
+    assert avoid_msg.count("contains ''") == 2
+    assert findings[2][2].endswith("missing across scanned pages: audit trail")
+
+
+def test_messaging_controls_automaton_matches_fallback(policy, monkeypatch):
+    monkeypatch.setattr(guardian, "ahocorasick", None)
+    expected = _run(policy)
+
+    monkeypatch.setattr(guardian, "ahocorasick", types.SimpleNamespace(Automaton=StubAutomaton))
+    assert isinstance(guardian.build_phrase_automaton(["Magic", ""]), StubAutomaton)
+    assert _run(policy) == expected
+
+
+def test_build_phrase_automaton_without_words(monkeypatch):
+    monkeypatch.setattr(guardian, "ahocorasick", types.SimpleNamespace(Automaton=StubAutomaton))
+    assert guardian.build_phrase_automaton(["", ""]) is None
@@ -0,0 +1,24 @@
+from ops import health_dashboard as dashboard
+
+
+def test_parse_jsonl_skips_complementary_broken_lines():
+    raw = b'{"a": 1}\n[1\n2]\n\n  \n{"a": [1\n{"x": 1}, {"y": 2}\n{"b": 2}\n'
+    assert dashboard._parse_jsonl(raw) == [{"a": 1}, {"b": 2}]
+
+
+def test_load_tail_records_matches_full_parse(tmp_path):
+    path = tmp_path / "health_log.jsonl"
+    lines = [b'{"i": %d, "pad": "%s"}' % (i, b"x" * (i % 7)) for i in range(200)]
+    lines.insert(150, b"{broken")
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    expected = dashboard._parse_jsonl(path.read_bytes())[-40:]
+    # a tiny window forces the cut-first-line and doubling paths
+    assert dashboard.load_tail_records(path, n=40, window=64) == expected
+    assert dashboard.load_tail_records(path, n=40) == expected
+
+
+def test_load_tail_records_short_and_missing_file(tmp_path):
+    path = tmp_path / "health_log.jsonl"
+    path.write_bytes(b'{"a": 1}\n{"b": 2}')
+    assert dashboard.load_tail_records(path, n=40) == [{"a": 1}, {"b": 2}]
+    assert dashboard.load_tail_records(tmp_path / "missing.jsonl") == []
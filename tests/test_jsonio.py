@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from ops import jsonio
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        (b"", None),
+        (b"\n \n", None),
+        (b'{"n": 1}', b'{"n": 1}'),
+        (b'{"n": 1}\n{"n": 2}\n\n', b'{"n": 2}'),
+    ],
+)
+def test_read_last_line(tmp_path, content, expected):
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(content)
+    assert jsonio.read_last_line(path) == expected
+
+
+def test_read_last_line_grows_window_past_chunk(tmp_path):
+    path = tmp_path / "log.jsonl"
+    lines = [json.dumps({"n": i, "pad": "x" * 100}) for i in range(50)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert jsonio.read_last_line(str(path), chunk=16) == lines[-1].encode("utf-8")
+
+
+def test_dumps_layout():
+    obj = {"a": [1, 2], "ü": None, 3: True}
+    assert jsonio.dumps(obj) == '{"a":[1,2],"ü":null,"3":true}'.encode("utf-8")
+    assert jsonio.dumps(obj, newline=True).endswith(b"}\n")
+    assert jsonio.dumps(obj, pretty=True) == json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    assert jsonio.loads(jsonio.dumps(obj)) == {"a": [1, 2], "ü": None, "3": True}
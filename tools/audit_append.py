@@ -16,6 +16,17 @@ except Exception:
     print("ERROR: PyYAML is required (pip install pyyaml)", file=sys.stderr)
     sys.exit(2)
 
+# libyaml-Loader (C), falls PyYAML damit gebaut ist – sonst der reine Python-Loader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    from ops.jsonio import read_last_line
+except ImportError:
+    # Skriptaufruf: tools/ liegt vorn auf sys.path und tools/ops verdeckt das
+    # Repo-Paket ops/ – daher ops/ direkt einhängen
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ops"))
+    from jsonio import read_last_line
+
 
 def sha256(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
@@ -33,11 +44,10 @@ def read_last_hash(log_path: str, anchor_path: str) -> str:
       - sonst Hash von leerem String
     """
     if os.path.isfile(log_path):
-        with open(log_path, "r", encoding="utf-8") as f:
-            lines = [ln.strip() for ln in f if ln.strip()]
-        if lines:
+        last_line = read_last_line(log_path)
+        if last_line:
             try:
-                last = json.loads(lines[-1])
+                last = json.loads(last_line)
                 return last.get("sha_current") or ""
             except Exception:
                 pass
@@ -71,8 +81,8 @@ def main():
     report_path = sys.argv[1]
     chain_cfg   = sys.argv[2]
 
-    with open(chain_cfg, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+    with open(chain_cfg, "rb") as f:
+        cfg = yaml.load(f, Loader=_YamlLoader)
 
     alg          = (cfg.get("integrity") or {}).get("algorithm", "SHA256")
     if alg.upper() != "SHA256":
@@ -98,8 +108,8 @@ def main():
     agent_name = rep.get("agent", "self_guardian")
     run_id = os.environ.get("GITHUB_RUN_ID") or os.environ.get("CI_RUN_ID") or "local"
 
-    appended = 0
     sha_prev = read_last_hash(audit_log, anchor_file)
+    lines = []  # alle Einträge sammeln und am Ende mit einem write() anhängen
 
     # Wenn der Report keine Issues enthält, optional einen "no-issues" Eintrag schreiben
     if not issues:
@@ -117,9 +127,7 @@ def main():
         material = "|".join(str(entry.get(k, "")) for k in fields if k not in ("sha_current",))
         entry["sha_current"] = sha256(material)
 
-        with open(audit_log, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        appended += 1
+        lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
     else:
         # Für jedes Issue einen Eintrag anfügen
         for it in issues:
@@ -136,11 +144,13 @@ def main():
             material = "|".join(str(e.get(k, "")) for k in fields if k not in ("sha_current",))
             e["sha_current"] = sha256(material)
 
-            with open(audit_log, "a", encoding="utf-8") as f:
-                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+            lines.append(json.dumps(e, ensure_ascii=False) + "\n")
 
             sha_prev = e["sha_current"]  # Chain fortsetzen
-            appended += 1
+
+    with open(audit_log, "ab") as f:
+        f.write("".join(lines).encode("utf-8"))
+    appended = len(lines)
 
     print(f"Appended {appended} audit entrie(s) to {audit_log}")
 
@@ -1,23 +1,32 @@
 
 from __future__ import annotations
-import os, uuid, time, socket, getpass
+import os, time, socket, getpass
 from datetime import datetime, timezone
 import orjson as json
 
 TELEMETRY_DIR = os.getenv("TELEMETRY_DIR", "logs/telemetry")
-os.makedirs(TELEMETRY_DIR, exist_ok=True)
+_ENSURED_DIRS: set[str] = set()  # Verzeichnisse erst beim ersten emit() anlegen, nicht beim Import
+
+def _ensure_dir(path: str) -> None:
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+def _gen_id() -> str:
+    # opake 32-stellige Hex-ID direkt aus os.urandom (ohne uuid.UUID-Umweg)
+    return os.urandom(16).hex()
 
 def emit(event_type: str, payload: dict, run_id: str | None = None) -> str:
     """
     Schreibt einen JSONL-Eintrag gem. ops/telemetry_schema.json.
     Gibt die event_id zurück.
     """
-    event_id = str(uuid.uuid4())
+    event_id = _gen_id()
     doc = {
         "event_id": event_id,
         "event_type": event_type,           # z.B. 'self_audit.completed'
         "ts": datetime.now(timezone.utc).isoformat(),
-        "run_id": run_id or os.getenv("GITHUB_RUN_ID") or str(uuid.uuid4()),
+        "run_id": run_id or os.getenv("GITHUB_RUN_ID") or _gen_id(),
         "actor": getpass.getuser(),
         "host": socket.gethostname(),
         "context": {
@@ -29,6 +38,7 @@ def emit(event_type: str, payload: dict, run_id: str | None = None) -> str:
         },
         "payload": payload,                 # frei, aber bitte schema-konform halten
     }
+    _ensure_dir(TELEMETRY_DIR)
     path = os.path.join(TELEMETRY_DIR, f"{int(time.time())}.jsonl")
     with open(path, "ab") as f:
         f.write(json.dumps(doc))